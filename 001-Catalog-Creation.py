@@ -23,12 +23,10 @@
 
 # COMMAND ----------
 
-from databricks.sdk import WorkspaceClient
+from lab_context import current_user, set_context
 
 # Get current user context for governance and unique naming
-w = WorkspaceClient()
-user_name = w.current_user.me().user_name
-user_id = w.current_user.me().user_name.split('@')[0]
+user_name, user_id = current_user()
 
 print(f"Current User: {user_name}")
 print(f"User ID for naming: {user_id}")
@@ -62,7 +60,7 @@ print(catalog_name)
 # COMMAND ----------
 
 # DBTITLE 1,Set catalog context for subsequent operations
-spark.sql(f"USE CATALOG `{catalog_name}`")
+set_context(spark, catalog_name)
 
 # COMMAND ----------
 
@@ -74,7 +72,7 @@ spark.sql(f"USE CATALOG `{catalog_name}`")
 # COMMAND ----------
 
 # DBTITLE 1,Verify catalog creation and examine properties
-spark.sql(f"DESCRIBE CATALOG EXTENDED `{catalog_name}`").display()
+spark.sql("DESCRIBE CATALOG EXTENDED IDENTIFIER(:catalog)", args={"catalog": f"`{catalog_name}`"}).display()
 
 # COMMAND ----------
 
@@ -148,7 +146,8 @@ spark.sql(f"DESCRIBE CATALOG EXTENDED `{catalog_name}`").display()
 # COMMAND ----------
 
 # DBTITLE 1,List volumes to confirm creation
-spark.sql(f"SHOW VOLUMES IN `{catalog_name}`.sales").display()
+# MAGIC %sql
+# MAGIC SHOW VOLUMES IN sales;
 
 # COMMAND ----------
 
@@ -20,26 +20,7 @@
 
 # COMMAND ----------
 
-from databricks.sdk import WorkspaceClient
-
-# Get current user context for governance and unique naming
-w = WorkspaceClient()
-user_name = w.current_user.me().user_name
-user_id = w.current_user.me().user_name.split('@')[0]
-
-print(f"Current User: {user_name}")
-print(f"User ID for naming: {user_id}")
-
-# COMMAND ----------
-
-catalog_name = user_id
-schema_name = "sales"
-
-# COMMAND ----------
-
-# Set catalog and schema context for subsequent operations
-spark.sql(f"USE CATALOG `{catalog_name}`")
-spark.sql(f"USE SCHEMA `{schema_name}`")
+# MAGIC %run ./_bootstrap
 
 # COMMAND ----------
 
@@ -70,18 +51,16 @@ spark.sql(f"USE SCHEMA `{schema_name}`")
 # COMMAND ----------
 
 # DBTITLE 1,Grant catalog-level permissions
-spark.sql(f"GRANT USE_CATALOG ON CATALOG `{catalog_name}` TO `{user_name}`;")
-spark.sql(f"GRANT BROWSE ON CATALOG `{catalog_name}` TO `{user_name}`;")
+spark.sql(f"GRANT USE_CATALOG, BROWSE ON CATALOG `{catalog_name}` TO `{user_name}`;")
 
 # COMMAND ----------
 
 # DBTITLE 1,Grant schema-level permissions
-spark.sql(f"GRANT USE_SCHEMA ON SCHEMA `{catalog_name}`.`{schema_name}` TO `account users`;")
+spark.sql(f"GRANT USE_SCHEMA, SELECT ON SCHEMA `{catalog_name}`.`{schema_name}` TO `account users`;")
 
 # COMMAND ----------
 
-# DBTITLE 1,Grant table creation and select permissions
-spark.sql(f"GRANT SELECT ON SCHEMA `{catalog_name}`.`{schema_name}` TO `account users`;")
+# DBTITLE 1,Grant table select permissions
 spark.sql(f"GRANT SELECT ON TABLE `{catalog_name}`.`{schema_name}`.sales_fact TO `account users`;")
 
 # COMMAND ----------
@@ -91,23 +70,23 @@ spark.sql(f"GRANT READ_VOLUME ON VOLUME `{catalog_name}`.`{schema_name}`.trackin
 
 # COMMAND ----------
 
-# DBTITLE 1,Display Catalog Permissions
-spark.sql(f"SHOW GRANTS ON CATALOG {catalog_name}").display()
-
-# COMMAND ----------
-
-# DBTITLE 1,Display Schema Permissions
-spark.sql(f"SHOW GRANTS ON SCHEMA {schema_name}").display()
+# DBTITLE 1,Display Catalog, Schema, Table and Volume Permissions
+from concurrent.futures import ThreadPoolExecutor
 
-# COMMAND ----------
+# The SHOW GRANTS lookups are independent, so fetch them concurrently and display in order
+grant_targets = [
+    ("catalog", f"`{catalog_name}`"),
+    ("schema", f"`{catalog_name}`.`{schema_name}`"),
+    ("table", f"`{catalog_name}`.`{schema_name}`.sales_fact"),
+    ("volume", f"`{catalog_name}`.`{schema_name}`.tracking"),
+]
 
-# DBTITLE 1,Display Table Permissions
-spark.sql(f"SHOW GRANTS ON TABLE {catalog_name}.{schema_name}.sales_fact").display()
-
-# COMMAND ----------
+with ThreadPoolExecutor(max_workers=len(grant_targets)) as pool:
+    grants = list(pool.map(lambda t: spark.sql(f"SHOW GRANTS ON {t[0].upper()} {t[1]}").toPandas(), grant_targets))
 
-# DBTITLE 1,Display Volume Permissions
-spark.sql(f"SHOW GRANTS ON VOLUME {catalog_name}.{schema_name}.tracking").display()
+for (kind, ref), grants_df in zip(grant_targets, grants):
+    print(f"Grants on {kind} {ref}")
+    display(grants_df)
 
 # COMMAND ----------
 
@@ -125,14 +104,12 @@ spark.sql(f"REVOKE SELECT ON TABLE `{catalog_name}`.`{schema_name}`.sales_fact F
 # COMMAND ----------
 
 # DBTITLE 1,Revoke Schema Level Permissions
-spark.sql(f"REVOKE SELECT ON SCHEMA `{catalog_name}`.`{schema_name}` FROM `account users`")
-spark.sql(f"REVOKE USE_SCHEMA ON SCHEMA `{catalog_name}`.`{schema_name}` FROM `account users`")
+spark.sql(f"REVOKE SELECT, USE_SCHEMA ON SCHEMA `{catalog_name}`.`{schema_name}` FROM `account users`")
 
 # COMMAND ----------
 
 # DBTITLE 1,Revoke Catalog Level Permissions
-spark.sql(f"REVOKE BROWSE ON CATALOG `{catalog_name}` FROM `account users`") 
-spark.sql(f"REVOKE USE_CATALOG ON CATALOG `{catalog_name}` FROM `account users`") 
+spark.sql(f"REVOKE BROWSE, USE_CATALOG ON CATALOG `{catalog_name}` FROM `account users`")
 
 # COMMAND ----------
 
@@ -144,33 +121,31 @@ spark.sql(f"REVOKE USE_CATALOG ON CATALOG `{catalog_name}` FROM `account users`"
 # COMMAND ----------
 
 # DBTITLE 1,Query table privileges from information schema
-spark.sql(f"""SELECT 
-  table_catalog,
-  table_schema,
-  table_name,
-  privilege_type,
-  inherited_from,
-  grantee
-FROM system.information_schema.table_privileges 
-WHERE table_catalog = '{catalog_name}'
-AND table_schema = '{schema_name}'
-ORDER BY table_schema, table_name, privilege_type
-""").display()
+# MAGIC %sql
+# MAGIC SELECT 
+# MAGIC   table_name,
+# MAGIC   privilege_type,
+# MAGIC   inherited_from,
+# MAGIC   grantee
+# MAGIC FROM system.information_schema.table_privileges 
+# MAGIC WHERE table_catalog = CURRENT_CATALOG()
+# MAGIC AND table_schema = CURRENT_SCHEMA()
+# MAGIC AND grantee IN ('account users', current_user())
+# MAGIC ORDER BY table_name, privilege_type;
 
 # COMMAND ----------
 
 # DBTITLE 1,Query schema privileges
-spark.sql(f"""SELECT 
-  catalog_name,
-  schema_name,
-  privilege_type,
-  inherited_from,
-  grantee
-FROM information_schema.schema_privileges 
-WHERE catalog_name = '{catalog_name}'
-AND schema_name = '{schema_name}'
-ORDER BY schema_name, privilege_type
-""").display()
+# MAGIC %sql
+# MAGIC SELECT 
+# MAGIC   privilege_type,
+# MAGIC   inherited_from,
+# MAGIC   grantee
+# MAGIC FROM system.information_schema.schema_privileges 
+# MAGIC WHERE catalog_name = CURRENT_CATALOG()
+# MAGIC AND schema_name = CURRENT_SCHEMA()
+# MAGIC AND grantee IN ('account users', current_user())
+# MAGIC ORDER BY privilege_type;
 
 # COMMAND ----------
 
@@ -187,8 +162,8 @@ ORDER BY schema_name, privilege_type
 # MAGIC - ✅ **Auditing**: Use `SHOW GRANTS` and `information_schema` for monitoring
 # MAGIC
 # MAGIC **Key Commands Used:**
-# MAGIC - `GRANT <permission> ON <object> TO <principal>`
-# MAGIC - `REVOKE <permission> ON <object> FROM <principal>` 
+# MAGIC - `GRANT <permission>[, <permission> ...] ON <object> TO <principal>`
+# MAGIC - `REVOKE <permission>[, <permission> ...] ON <object> FROM <principal>` 
 # MAGIC - `SHOW GRANTS ON <object>`
 # MAGIC - `information_schema.table_privileges`
 # MAGIC - `information_schema.schema_privileges`
@@ -20,26 +20,7 @@
 
 # COMMAND ----------
 
-from databricks.sdk import WorkspaceClient
-
-# Get current user context for governance and unique naming
-w = WorkspaceClient()
-user_name = w.current_user.me().user_name
-user_id = w.current_user.me().user_name.split('@')[0]
-
-print(f"Current User: {user_name}")
-print(f"User ID for naming: {user_id}")
-
-# COMMAND ----------
-
-catalog_name = user_id
-schema_name = "sales"
-
-# COMMAND ----------
-
-# Set catalog and schema context for subsequent operations
-spark.sql(f"USE CATALOG `{catalog_name}`")
-spark.sql(f"USE SCHEMA `{schema_name}`")
+# MAGIC %run ./_bootstrap
 
 # COMMAND ----------
 
@@ -51,11 +32,13 @@ spark.sql(f"USE SCHEMA `{schema_name}`")
 
 # COMMAND ----------
 
-spark.sql(f"SELECT * FROM `{catalog_name}`.`{schema_name}`.`customers`").display()
+# MAGIC %sql
+# MAGIC SELECT * FROM customers LIMIT 1000;
 
 # COMMAND ----------
 
-spark.sql(f"SELECT * FROM `{catalog_name}`.`{schema_name}`.`suppliers`").display()
+# MAGIC %sql
+# MAGIC SELECT * FROM suppliers LIMIT 1000;
 
 # COMMAND ----------
 
@@ -87,7 +70,7 @@ spark.sql(f"""
 # COMMAND ----------
 
 # DBTITLE 1,Create ABAC Policy: Row Filtering
-spark.sql(f"""CREATE POLICY nation_filter
+spark.sql(f"""CREATE OR REPLACE POLICY nation_filter
               ON SCHEMA {catalog_name}.{schema_name}
               COMMENT 'Filter out nations for non-HR users'
               ROW FILTER {catalog_name}.{schema_name}.filter_nation
@@ -101,7 +84,7 @@ spark.sql(f"""CREATE POLICY nation_filter
 # COMMAND ----------
 
 # DBTITLE 1,Create ABAC Policy: Column Masking
-spark.sql(f"""CREATE POLICY mask_address
+spark.sql(f"""CREATE OR REPLACE POLICY mask_address
               ON SCHEMA {catalog_name}.{schema_name}
               COMMENT 'Mask PII address information.'
               COLUMN MASK {catalog_name}.{schema_name}.mask_address
@@ -123,12 +106,14 @@ spark.sql(f"ALTER TABLE {catalog_name}.{schema_name}.suppliers ALTER COLUMN n_na
 # COMMAND ----------
 
 # DBTITLE 1,Test Applied Permissions: Customers
-spark.sql(f"SELECT * FROM `{catalog_name}`.`{schema_name}`.`customers`").display()
+# MAGIC %sql
+# MAGIC SELECT * FROM customers LIMIT 1000;
 
 # COMMAND ----------
 
 # DBTITLE 1,Test Applied Permissions: Suppliers
-spark.sql(f"SELECT * FROM `{catalog_name}`.`{schema_name}`.`suppliers`").display()
+# MAGIC %sql
+# MAGIC SELECT * FROM suppliers LIMIT 1000;
 
 # COMMAND ----------
 
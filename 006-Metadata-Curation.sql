@@ -52,11 +52,9 @@
 -- COMMAND ----------
 
 -- MAGIC %python
--- MAGIC from databricks.sdk import WorkspaceClient
+-- MAGIC from lab_context import current_user
 -- MAGIC
 -- MAGIC # Get current user context for governance and unique naming
--- MAGIC w = WorkspaceClient()
--- MAGIC user_name = w.current_user.me().user_name
--- MAGIC user_id = w.current_user.me().user_name.split('@')[0]
+-- MAGIC user_name, user_id = current_user()
 -- MAGIC
 -- MAGIC print(f"Your catalog is named: {user_id}")
@@ -0,0 +1,32 @@
+# Databricks notebook source
+# MAGIC %md
+# MAGIC # Unity Catalog Lab: Shared Bootstrap
+# MAGIC
+# MAGIC Shared setup for Labs 3-5. Include it with `%run ./_bootstrap` to define
+# MAGIC `user_name`, `user_id`, `catalog_name` and `schema_name` and set the catalog and schema context.
+# MAGIC Lab 1 creates the `sales` schema and sets its own context instead.
+
+# COMMAND ----------
+
+from py4j.protocol import Py4JError
+
+from lab_context import current_user, set_context
+
+# Read the user from the notebook context, which needs no REST call, and
+# fall back to the cached SCIM lookup when the context is not available
+try:
+    user_name = dbutils.notebook.entry_point.getDbutils().notebook().getContext().userName().get()
+    user_id = user_name.split('@')[0]
+except (AttributeError, Py4JError):
+    user_name, user_id = current_user()
+
+print(f"Current User: {user_name}")
+print(f"User ID for naming: {user_id}")
+
+# COMMAND ----------
+
+catalog_name = user_id
+schema_name = "sales"
+
+# Set catalog and schema context for subsequent operations
+set_context(spark, catalog_name, schema_name)
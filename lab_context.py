@@ -0,0 +1,24 @@
+"""Shared user and catalog context for the Unity Catalog lab notebooks."""
+
+import functools
+
+from databricks.sdk import WorkspaceClient
+from pyspark.sql import SparkSession
+
+
+@functools.lru_cache(maxsize=1)
+def current_user() -> tuple[str, str]:
+    """Return ``(user_name, user_id)`` for the current user, calling the SCIM API once."""
+    # Build the client on first use so importing this module never runs auth discovery
+    w = WorkspaceClient()
+    user_name = w.current_user.me().user_name
+    user_id = user_name.split('@')[0]
+    return user_name, user_id
+
+
+def set_context(spark: SparkSession, catalog: str, schema: str | None = None) -> None:
+    """Switch ``spark`` to ``catalog``/``schema``, skipping USE when already there."""
+    if spark.catalog.currentCatalog().lower() != catalog.lower():
+        spark.sql("USE CATALOG IDENTIFIER(:catalog)", args={"catalog": f"`{catalog}`"})
+    if schema is not None and spark.catalog.currentDatabase().lower() != schema.lower():
+        spark.sql("USE SCHEMA IDENTIFIER(:schema)", args={"schema": f"`{schema}`"})